@@ -0,0 +1,97 @@
+"""
+Latency benchmark for POST /api/basket/optimize.
+
+Seeds a catalog of medicines, each with several generic alternatives, then
+times optimizing random prescriptions against it.
+
+Usage (from the backend directory):
+    python benchmarks/bench_basket.py [--medicines 20000] [--alternatives 8] [--items 50]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import config, Config
+from models import db, Medicine, GenericAlternative
+
+MANUFACTURERS = ['Zydus Pharmaceuticals', 'Micro Labs Limited', 'Cipla', 'Sun Pharma', 'Lupin']
+
+
+def seed(medicines, alternatives):
+    rng = random.Random(0)
+    db.create_all()
+    db.session.execute(db.insert(Medicine), [
+        {
+            'id': i,
+            'name': f'Medicine {i}',
+            'description': 'Benchmark medicine',
+            'price': rng.uniform(10, 500),
+            'rating': rng.uniform(1, 5),
+            'manufacturer': rng.choice(MANUFACTURERS)
+        }
+        for i in range(1, medicines + 1)
+    ])
+    db.session.execute(db.insert(GenericAlternative), [
+        {
+            'medicine_id': i,
+            'name': f'Generic {i}-{j}',
+            'price': rng.uniform(5, 500),
+            'discount': rng.choice([None, 0, 5, 10, 15, 25]),
+            'rating': rng.uniform(1, 5),
+            'manufacturer': rng.choice(MANUFACTURERS),
+            'availability': rng.choice(['In Stock', 'Available', 'Out of Stock'])
+        }
+        for i in range(1, medicines + 1) for j in range(alternatives)
+    ])
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--medicines', type=int, default=20000)
+    parser.add_argument('--alternatives', type=int, default=8)
+    parser.add_argument('--items', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config['bench_basket'] = type('bench_basket', (Config,), {
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+        })
+        app = create_app('bench_basket')
+        with app.app_context():
+            seed(args.medicines, args.alternatives)
+        client = app.test_client()
+
+        rng = random.Random(1)
+        timings = []
+        for _ in range(args.requests):
+            payload = {
+                'items': [
+                    {'medicine_id': medicine_id, 'quantity': rng.randint(1, 3)}
+                    for medicine_id in rng.sample(range(1, args.medicines + 1), args.items)
+                ],
+                'min_rating': 3.0,
+                'same_manufacturer': rng.random() < 0.5
+            }
+            start = time.perf_counter()
+            response = client.post('/api/basket/optimize', json=payload)
+            timings.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.get_json()
+
+        timings.sort()
+        print(f"{args.items}-item prescriptions, {args.medicines} medicines x {args.alternatives} alternatives")
+        print(f"p50 {statistics.median(timings) * 1000:.2f} ms, "
+              f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms, "
+              f"max {timings[-1] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Compression benchmark for the medicine detail endpoint.
+
+Requests /api/medicines/<id> with each Accept-Encoding and reports bytes on
+the wire and CPU time per request, both with a cold compressed-body store
+(compress on every request) and a warm one (reuse stored bytes). End-to-end
+numbers include Flask dispatch and JSON encoding, so the compression step is
+also timed on its own: a raw compress call against a store lookup.
+
+Each path is warmed up first, then the rows are interleaved over several
+rounds and the best time per row is reported.
+
+Every compressed response is decompressed and checked against the identity
+body. The br rows are skipped when the Brotli package is not installed.
+
+Usage (from the backend directory):
+    python benchmarks/bench_compression.py [--requests 500] [--rounds 5]
+"""
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, initialize_db
+from compression import ENCODERS, brotli
+from config import config, Config
+from models import Medicine
+
+DECODERS = {'gzip': gzip.decompress}
+if brotli is not None:
+    DECODERS['br'] = brotli.decompress
+
+
+def measure(client, url, encoding, requests, store=None):
+    headers = {'Accept-Encoding': encoding or 'identity'}
+    body = b''
+    start = time.process_time()
+    for _ in range(requests):
+        if store is not None:
+            store.clear()
+        response = client.get(url, headers=headers)
+        body = response.get_data()
+    cpu = time.process_time() - start
+    return response, body, cpu / requests * 1e6
+
+
+def time_calls(fn, requests):
+    start = time.process_time()
+    for _ in range(requests):
+        fn()
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config['bench_compression'] = type('bench_compression', (Config,), {
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+        })
+        app = create_app('bench_compression')
+        with app.app_context():
+            initialize_db()
+            url = f'/api/medicines/{Medicine.query.first().id}'
+        store = app.extensions['compressed_body_store']
+        client = app.test_client()
+
+        if brotli is None:
+            print("Brotli is not installed; skipping br")
+
+        # Warm up every path (imports, SQLAlchemy caches, allocator) so the
+        # first row measured is not paying one-off costs
+        for encoding in (None, *ENCODERS):
+            measure(client, url, encoding, max(args.requests // 4, 100))
+
+        # Interleave the rows over several rounds and keep each row's best
+        # time, so machine noise does not land on whichever row ran first
+        rows = [('identity', None, '-', None)]
+        for encoding in ENCODERS:
+            rows.append((encoding, encoding, 'cold', store))
+            rows.append((encoding, encoding, 'warm', None))
+        best = {}
+        for _ in range(args.rounds):
+            for label, encoding, mode, cold_store in rows:
+                response, body, cpu = measure(client, url, encoding, args.requests, cold_store)
+                best[label, mode] = min(cpu, best.get((label, mode), cpu))
+
+        plain = client.get(url, headers={'Accept-Encoding': 'identity'}).get_data()
+        print("End-to-end request")
+        print(f"{'encoding':<10}{'store':<7}{'bytes':>8}{'cpu us/req':>12}")
+        for label, encoding, mode, _ in rows:
+            body = plain
+            if encoding is not None:
+                response = client.get(url, headers={'Accept-Encoding': encoding})
+                body = response.get_data()
+                assert response.headers['Content-Encoding'] == encoding
+                assert DECODERS[encoding](body) == plain, f"{encoding} body does not round-trip"
+            print(f"{label:<10}{mode:<7}{len(body):>8}{best[label, mode]:>12.1f}")
+
+        print()
+        print("Compression step only")
+        print(f"{'encoding':<10}{'raw compress us':>17}{'store hit us':>14}")
+        for encoding, compress in ENCODERS.items():
+            encode = lambda data: compress(data, app)
+            store.get_or_compress(plain, encoding, encode)
+            raw = time_calls(lambda: encode(plain), args.requests)
+            hit = time_calls(lambda: store.get_or_compress(plain, encoding, encode), args.requests)
+            print(f"{encoding:<10}{raw:>17.1f}{hit:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Concurrency benchmark for the SQLite connection settings.
+
+Runs reader processes that load medicine details while a writer process adds
+reviews at a fixed rate, once with SQLite's default rollback journal and once
+with the WAL PRAGMAs from config.py, and reports reader throughput and latency
+at equal write load. Readers and the writer are separate processes so they do
+not compete for one GIL and the numbers reflect database locking.
+
+Usage (from the backend directory):
+    python benchmarks/bench_sqlite_concurrency.py [--readers 4] [--seconds 5] [--writes-per-sec 20]
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, initialize_db
+from config import config, Config
+from models import db, Medicine, Review
+
+
+def make_app(name, db_path, pragmas):
+    config[name] = type(name, (Config,), {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'SQLITE_PRAGMAS': pragmas,
+    })
+    return create_app(name)
+
+
+def reader(scenario, medicine_id, start, stop, results):
+    app = make_app(*scenario)
+    latencies = []
+    errors = 0
+    with app.app_context():
+        start.wait()
+        while not stop.is_set():
+            began = time.perf_counter()
+            try:
+                medicine = db.session.get(Medicine, medicine_id)
+                len(medicine.reviews)
+                db.session.rollback()
+                db.session.expire_all()
+            except Exception:
+                db.session.rollback()
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - began)
+    results.put(('read', latencies, errors))
+
+
+def writer(scenario, medicine_id, writes_per_sec, start, stop, results):
+    app = make_app(*scenario)
+    writes = 0
+    errors = 0
+    # Pace commits on a fixed schedule so both modes see the same write load
+    interval = 1.0 / writes_per_sec
+    with app.app_context():
+        start.wait()
+        next_write = time.perf_counter()
+        while not stop.wait(max(0.0, next_write - time.perf_counter())):
+            next_write += interval
+            try:
+                db.session.add(Review(medicine_id=medicine_id, rating=4, comment='benchmark'))
+                db.session.commit()
+                medicine = db.session.get(Medicine, medicine_id)
+                ratings = [r.rating for r in medicine.reviews]
+                medicine.rating = sum(ratings) / len(ratings)
+                db.session.commit()
+                writes += 1
+            except Exception:
+                db.session.rollback()
+                errors += 1
+    results.put(('write', writes, errors))
+
+
+def run(scenario, readers, seconds, writes_per_sec):
+    app = make_app(*scenario)
+    with app.app_context():
+        initialize_db()
+        medicine_id = Medicine.query.first().id
+        db.engine.dispose()
+
+    start = multiprocessing.Event()
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue()
+
+    processes = [
+        multiprocessing.Process(target=reader, args=(scenario, medicine_id, start, stop, results))
+        for _ in range(readers)
+    ]
+    processes.append(multiprocessing.Process(
+        target=writer, args=(scenario, medicine_id, writes_per_sec, start, stop, results)))
+    for p in processes:
+        p.start()
+
+    # Give every process time to import and connect before the clock starts
+    time.sleep(1)
+    start.set()
+    time.sleep(seconds)
+    stop.set()
+
+    latencies = []
+    writes = 0
+    errors = 0
+    for _ in processes:
+        kind, value, failed = results.get()
+        errors += failed
+        if kind == 'read':
+            latencies.extend(value)
+        else:
+            writes = value
+    for p in processes:
+        p.join()
+
+    latencies.sort()
+    return {
+        'reads_per_sec': len(latencies) / seconds,
+        'writes_per_sec': writes / seconds,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else float('nan'),
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float('nan'),
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--writes-per-sec', type=float, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenarios = [
+            ('rollback journal', ('bench_default', os.path.join(tmp, 'default.db'), {})),
+            ('WAL pragmas', ('bench_wal', os.path.join(tmp, 'wal.db'), Config.SQLITE_PRAGMAS)),
+        ]
+        print(f"{'mode':<18}{'reads/s':>10}{'writes/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for label, scenario in scenarios:
+            r = run(scenario, args.readers, args.seconds, args.writes_per_sec)
+            print(f"{label:<18}{r['reads_per_sec']:>10.0f}{r['writes_per_sec']:>10.0f}"
+                  f"{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['errors']:>8}")
+
+
+if __name__ == '__main__':
+    main()
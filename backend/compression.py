@@ -0,0 +1,119 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available
+    brotli = None
+
+
+def _gzip(body, app):
+    return gzip.compress(body, compresslevel=app.config['COMPRESS_GZIP_LEVEL'], mtime=0)
+
+
+def _brotli(body, app):
+    return brotli.compress(body, quality=app.config['COMPRESS_BROTLI_QUALITY'])
+
+
+# Preferred encodings first
+ENCODERS = OrderedDict()
+if brotli is not None:
+    ENCODERS['br'] = _brotli
+ENCODERS['gzip'] = _gzip
+
+
+class CompressedBodyStore:
+    """LRU store of compressed response bodies keyed by content hash and encoding
+
+    Entries are evicted oldest first until the stored bytes fit in max_bytes.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, body, encoding, compress):
+        key = (hashlib.sha256(body).hexdigest(), encoding)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                return compressed
+
+        # Compress outside the lock so other requests are not held up
+        compressed = compress(body)
+        if len(compressed) > self.max_bytes:
+            return compressed
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _choose_encoding():
+    """Pick the supported encoding the client weights highest; ties go to ENCODERS order"""
+    accepted = request.accept_encodings
+    encoding = max(ENCODERS, key=lambda e: accepted[e])
+    if accepted[encoding] > 0:
+        return encoding
+    return None
+
+
+def init_compression(app):
+    """Compress JSON responses above COMPRESS_MIN_SIZE using the client's preferred encoding
+
+    Only responses from COMPRESS_CACHE_ENDPOINTS are kept in the store; other
+    responses are compressed on every request.
+    """
+    store = CompressedBodyStore(app.config['COMPRESS_CACHE_MAX_BYTES'])
+    app.extensions['compressed_body_store'] = store
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or response.mimetype not in app.config['COMPRESS_MIMETYPES']
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        body = response.get_data()
+        if len(body) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+
+        compress = ENCODERS[encoding]
+        if request.endpoint in app.config['COMPRESS_CACHE_ENDPOINTS']:
+            response.set_data(store.get_or_compress(body, encoding, lambda data: compress(data, app)))
+        else:
+            response.set_data(compress(body, app))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    return store
@@ -34,7 +34,7 @@ class Medicine(db.Model):
 
 class GenericAlternative(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    medicine_id = db.Column(db.Integer, db.ForeignKey('medicine.id'), nullable=False)
+    medicine_id = db.Column(db.Integer, db.ForeignKey('medicine.id'), nullable=False, index=True)
     name = db.Column(db.String(100), nullable=False)
     price = db.Column(db.Float, nullable=False)
     discount = db.Column(db.Integer, nullable=True)
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from werkzeug.security import generate_password_hash, check_password_hash
 from models import db, User
@@ -8,7 +8,6 @@ auth_bp = Blueprint('auth', __name__)
 @auth_bp.route('/login', methods=['POST'])
 def login():
     data = request.get_json()
-    print("Received login data:", data)  # 🔍 Debugging line
 
     username = data.get('username')
     password = data.get('password')
@@ -16,8 +15,8 @@ def login():
     if not username or not password:
         return jsonify({"message": "Username and password are required"}), 400
 
+    current_app.logger.info("Login attempt for: %s", username)
     user = User.query.filter_by(username=username).first()
-    print("User from DB:", user)  # 🔍 Debugging line
 
     if user and check_password_hash(user.password, password):
         access_token = create_access_token(identity=user.id)
@@ -0,0 +1,176 @@
+import math
+
+from flask import Blueprint, request, jsonify
+from sqlalchemy import func
+from models import db, Medicine, GenericAlternative
+
+basket_bp = Blueprint('basket', __name__)
+
+DEFAULT_AVAILABILITY = ['In Stock', 'Available']
+
+# Upper bounds on request lists; their values are bound into IN (...)
+# clauses, so this keeps queries under SQLite's bound-parameter limit.
+MAX_BASKET_ITEMS = 200
+MAX_AVAILABILITY_VALUES = 10
+
+# Bounds on scalar inputs so values fit the database's integer columns and
+# prices stay finite
+MAX_MEDICINE_ID = 2 ** 63 - 1
+MAX_QUANTITY = 1000
+FILTER_RANGES = {
+    'min_rating': (0, 5),
+    'min_discount': (0, 100),
+}
+
+def _parse_items(items):
+    """Validate the prescription and merge repeated medicine ids"""
+    if not isinstance(items, list) or not items:
+        return None, "items must be a non-empty list"
+    if len(items) > MAX_BASKET_ITEMS:
+        return None, f"items cannot contain more than {MAX_BASKET_ITEMS} entries"
+
+    quantities = {}
+    for item in items:
+        if not isinstance(item, dict):
+            return None, "Each item must be an object with medicine_id and quantity"
+        medicine_id = item.get('medicine_id')
+        quantity = item.get('quantity', 1)
+        if not isinstance(medicine_id, int) or isinstance(medicine_id, bool) or not 1 <= medicine_id <= MAX_MEDICINE_ID:
+            return None, "medicine_id must be a positive integer"
+        if not isinstance(quantity, int) or isinstance(quantity, bool) or not 1 <= quantity <= MAX_QUANTITY:
+            return None, f"quantity must be an integer between 1 and {MAX_QUANTITY}"
+        quantities[medicine_id] = quantities.get(medicine_id, 0) + quantity
+
+    return quantities, None
+
+def _unit_price(price, discount):
+    return price * (100 - (discount or 0)) / 100
+
+@basket_bp.route('/optimize', methods=['POST'])
+def optimize_basket():
+    """
+    Pick the cheapest option for every medicine in a prescription, choosing
+    between the original medicine and its generic alternatives.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"message": "Request body must be a JSON object"}), 400
+
+    quantities, error = _parse_items(data.get('items'))
+    if error:
+        return jsonify({"message": error}), 400
+
+    availability = data.get('availability', DEFAULT_AVAILABILITY)
+    min_rating = data.get('min_rating')
+    min_discount = data.get('min_discount')
+    same_manufacturer = data.get('same_manufacturer', False)
+
+    if not isinstance(availability, list) or not all(isinstance(a, str) for a in availability):
+        return jsonify({"message": "availability must be a list of strings"}), 400
+    if len(availability) > MAX_AVAILABILITY_VALUES:
+        return jsonify({"message": f"availability cannot contain more than {MAX_AVAILABILITY_VALUES} values"}), 400
+    for name, value in (('min_rating', min_rating), ('min_discount', min_discount)):
+        if value is None:
+            continue
+        low, high = FILTER_RANGES[name]
+        if (not isinstance(value, (int, float)) or isinstance(value, bool)
+                or (isinstance(value, float) and not math.isfinite(value))
+                or not low <= value <= high):
+            return jsonify({"message": f"{name} must be a number between {low} and {high}"}), 400
+    if not isinstance(same_manufacturer, bool):
+        return jsonify({"message": "same_manufacturer must be a boolean"}), 400
+
+    medicine_ids = list(quantities)
+
+    # Load only the columns needed for pricing, in one query per table
+    medicines = {
+        row.id: row for row in db.session.execute(
+            db.select(Medicine.id, Medicine.name, Medicine.price, Medicine.manufacturer)
+            .where(Medicine.id.in_(medicine_ids))
+        )
+    }
+    missing = [medicine_id for medicine_id in medicine_ids if medicine_id not in medicines]
+    if missing:
+        return jsonify({"message": "Medicines not found", "missing_ids": missing}), 404
+
+    alternatives_query = (
+        db.select(
+            GenericAlternative.id,
+            GenericAlternative.medicine_id,
+            GenericAlternative.name,
+            GenericAlternative.price,
+            GenericAlternative.discount,
+            GenericAlternative.rating,
+            GenericAlternative.manufacturer,
+            GenericAlternative.availability,
+        )
+        .where(GenericAlternative.medicine_id.in_(medicine_ids))
+        .where(GenericAlternative.availability.in_(availability))
+    )
+    if min_rating is not None:
+        alternatives_query = alternatives_query.where(GenericAlternative.rating >= min_rating)
+    if min_discount is not None:
+        alternatives_query = alternatives_query.where(func.coalesce(GenericAlternative.discount, 0) >= min_discount)
+
+    # Cheapest alternative per medicine, kept as (unit_price, row)
+    cheapest = {}
+    for alt in db.session.execute(alternatives_query):
+        if same_manufacturer and alt.manufacturer != medicines[alt.medicine_id].manufacturer:
+            continue
+        unit_price = _unit_price(alt.price, alt.discount)
+        best = cheapest.get(alt.medicine_id)
+        if best is None or unit_price < best[0]:
+            cheapest[alt.medicine_id] = (unit_price, alt)
+
+    result_items = []
+    total = 0.0
+    original_total = 0.0
+
+    for medicine_id, quantity in quantities.items():
+        medicine = medicines[medicine_id]
+        original_line_total = medicine.price * quantity
+        best = cheapest.get(medicine_id)
+
+        # Keep the original when no alternative is strictly cheaper
+        if best is not None and best[0] < medicine.price:
+            unit_price, alt = best
+            choice = {
+                'type': 'alternative',
+                'id': alt.id,
+                'name': alt.name,
+                'manufacturer': alt.manufacturer,
+                'price': alt.price,
+                'discount': alt.discount,
+                'rating': alt.rating,
+                'availability': alt.availability
+            }
+        else:
+            unit_price = medicine.price
+            choice = {
+                'type': 'original',
+                'id': medicine.id,
+                'name': medicine.name,
+                'manufacturer': medicine.manufacturer,
+                'price': medicine.price
+            }
+
+        line_total = unit_price * quantity
+        total += line_total
+        original_total += original_line_total
+
+        result_items.append({
+            'medicine_id': medicine_id,
+            'quantity': quantity,
+            'choice': choice,
+            'unit_price': round(unit_price, 2),
+            'line_total': round(line_total, 2),
+            'original_line_total': round(original_line_total, 2),
+            'savings': round(original_line_total - line_total, 2)
+        })
+
+    return jsonify({
+        'items': result_items,
+        'total': round(total, 2),
+        'original_total': round(original_total, 2),
+        'savings': round(original_total - total, 2)
+    }), 200
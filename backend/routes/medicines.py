@@ -6,7 +6,7 @@ from flask_cors import CORS  # Import CORS
 medicines_bp = Blueprint('medicines', __name__)
 CORS(medicines_bp)  # Apply CORS to all routes in this blueprint
 
-@medicines_bp.route('/api/featured-medicine', methods=['GET'])
+@medicines_bp.route('/featured', methods=['GET'])
 def get_featured_medicine():
     """
     Get a featured medicine (could be based on most popular, newest, etc.)
@@ -45,7 +45,7 @@ def get_featured_medicine():
         return jsonify({"message": f"Error fetching featured medicine: {str(e)}"}), 500
 
 # Your existing routes below
-@medicines_bp.route('/', methods=['GET'])
+@medicines_bp.route('/', methods=['GET'], strict_slashes=False)
 def get_medicines():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
@@ -0,0 +1,168 @@
+"""
+Tests for POST /api/basket/optimize.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import config, Config
+from models import db, Medicine, GenericAlternative
+
+URL = '/api/basket/optimize'
+
+
+@pytest.fixture
+def app(tmp_path):
+    config['test_basket'] = type('test_basket', (Config,), {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'basket.db'}",
+    })
+    app = create_app('test_basket')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def add_medicine(id, price, manufacturer='Zydus Pharmaceuticals'):
+    db.session.add(Medicine(id=id, name=f'Medicine {id}', description='Test medicine',
+                            price=price, manufacturer=manufacturer))
+
+
+def add_alternative(id, medicine_id, price, discount=None, rating=4.0,
+                    manufacturer='Micro Labs Limited', availability='In Stock'):
+    db.session.add(GenericAlternative(id=id, medicine_id=medicine_id, name=f'Generic {id}',
+                                      price=price, discount=discount, rating=rating,
+                                      manufacturer=manufacturer, availability=availability))
+
+
+def optimize(client, items, **options):
+    return client.post(URL, json={'items': items, **options})
+
+
+def choice(response, index=0):
+    return response.get_json()['items'][index]['choice']
+
+
+def test_cheaper_discounted_alternative_wins(client):
+    add_medicine(1, price=100)
+    add_alternative(10, 1, price=95)
+    add_alternative(11, 1, price=100, discount=20)
+    db.session.commit()
+
+    response = optimize(client, [{'medicine_id': 1, 'quantity': 2}])
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert choice(response)['type'] == 'alternative'
+    assert choice(response)['id'] == 11
+    assert data['items'][0]['unit_price'] == 80
+    assert data['total'] == 160
+    assert data['original_total'] == 200
+    assert data['savings'] == 40
+
+
+def test_tie_keeps_original(client):
+    add_medicine(1, price=100)
+    add_alternative(10, 1, price=125, discount=20)
+    db.session.commit()
+
+    response = optimize(client, [{'medicine_id': 1}])
+
+    assert choice(response)['type'] == 'original'
+    assert response.get_json()['savings'] == 0
+
+
+def test_availability_excludes_alternatives(client):
+    add_medicine(1, price=100)
+    add_alternative(10, 1, price=50, availability='Out of Stock')
+    add_alternative(11, 1, price=60, availability='Available')
+    add_alternative(12, 1, price=70, availability='In Stock')
+    db.session.commit()
+
+    assert choice(optimize(client, [{'medicine_id': 1}]))['id'] == 11
+    assert choice(optimize(client, [{'medicine_id': 1}], availability=['In Stock']))['id'] == 12
+
+
+def test_min_rating_excludes_alternatives(client):
+    add_medicine(1, price=100)
+    add_alternative(10, 1, price=50, rating=3.5)
+    add_alternative(11, 1, price=60, rating=4.5)
+    add_alternative(12, 1, price=40, rating=None)
+    db.session.commit()
+
+    assert choice(optimize(client, [{'medicine_id': 1}]))['id'] == 12
+    assert choice(optimize(client, [{'medicine_id': 1}], min_rating=4))['id'] == 11
+
+
+def test_min_discount_treats_null_as_zero(client):
+    add_medicine(1, price=100)
+    add_alternative(10, 1, price=50, discount=None)
+    add_alternative(11, 1, price=80, discount=10)
+    db.session.commit()
+
+    assert choice(optimize(client, [{'medicine_id': 1}], min_discount=0))['id'] == 10
+    assert choice(optimize(client, [{'medicine_id': 1}], min_discount=5))['id'] == 11
+
+
+def test_same_manufacturer(client):
+    add_medicine(1, price=100, manufacturer='Cipla')
+    add_alternative(10, 1, price=50, manufacturer='Sun Pharma')
+    add_alternative(11, 1, price=70, manufacturer='Cipla')
+    db.session.commit()
+
+    assert choice(optimize(client, [{'medicine_id': 1}]))['id'] == 10
+    assert choice(optimize(client, [{'medicine_id': 1}], same_manufacturer=True))['id'] == 11
+
+
+def test_repeated_medicine_ids_are_merged(client):
+    add_medicine(1, price=100)
+    add_medicine(2, price=30)
+    db.session.commit()
+
+    response = optimize(client, [
+        {'medicine_id': 1, 'quantity': 2},
+        {'medicine_id': 2},
+        {'medicine_id': 1, 'quantity': 3},
+    ])
+
+    items = response.get_json()['items']
+    assert [(item['medicine_id'], item['quantity']) for item in items] == [(1, 5), (2, 1)]
+    assert response.get_json()['total'] == 530
+
+
+def test_unknown_ids_return_404(client):
+    add_medicine(1, price=100)
+    db.session.commit()
+
+    response = optimize(client, [{'medicine_id': 1}, {'medicine_id': 7}, {'medicine_id': 9}])
+
+    assert response.status_code == 404
+    assert response.get_json()['missing_ids'] == [7, 9]
+
+
+@pytest.mark.parametrize('body', [
+    '[1, 2]',
+    '{"items": []}',
+    '{"items": [{"medicine_id": 1180591620717411303424}]}',
+    '{"items": [{"medicine_id": 1, "quantity": 1001}]}',
+    '{"items": [{"medicine_id": 1}], "min_rating": NaN}',
+    '{"items": [{"medicine_id": 1}], "min_discount": Infinity}',
+])
+def test_invalid_requests_return_400(client, body):
+    response = client.post(URL, data=body, content_type='application/json')
+
+    assert response.status_code == 400
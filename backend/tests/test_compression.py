@@ -0,0 +1,110 @@
+"""
+Tests for negotiated response compression and the compressed-body store.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import gzip
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from compression import CompressedBodyStore, brotli
+from config import config, Config
+from models import db, Medicine
+
+LONG_TEXT = 'Helps in improving liver function. ' * 100
+
+
+@pytest.fixture
+def app(tmp_path):
+    config['test_compression'] = type('test_compression', (Config,), {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'compression.db'}",
+    })
+    app = create_app('test_compression')
+    with app.app_context():
+        db.create_all()
+        for i in range(1, 21):
+            db.session.add(Medicine(id=i, name=f'Medicine {i}', description=LONG_TEXT, price=10 * i))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_store_evicts_oldest_entries_to_fit_byte_budget():
+    store = CompressedBodyStore(max_bytes=10)
+    store.get_or_compress(b'a', 'gzip', lambda body: b'x' * 4)
+    store.get_or_compress(b'b', 'gzip', lambda body: b'x' * 4)
+    store.get_or_compress(b'c', 'gzip', lambda body: b'x' * 4)
+
+    assert len(store) == 2
+    assert store.size == 8
+
+
+def test_store_skips_bodies_larger_than_budget():
+    store = CompressedBodyStore(max_bytes=10)
+
+    assert store.get_or_compress(b'a', 'gzip', lambda body: b'x' * 11) == b'x' * 11
+    assert len(store) == 0
+    assert store.size == 0
+
+
+def test_store_reuses_compressed_body():
+    store = CompressedBodyStore()
+    calls = []
+
+    def compress(body):
+        calls.append(body)
+        return gzip.compress(body)
+
+    first = store.get_or_compress(b'body', 'gzip', compress)
+    second = store.get_or_compress(b'body', 'gzip', compress)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_client_q_values_choose_encoding(client):
+    plain = client.get('/api/medicines/1', headers={'Accept-Encoding': 'identity'}).get_data()
+    response = client.get('/api/medicines/1', headers={'Accept-Encoding': 'gzip;q=1.0, br;q=0.1'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.get_data()) == plain
+
+
+@pytest.mark.skipif(brotli is None, reason='Brotli is not installed')
+def test_brotli_round_trip(client):
+    plain = client.get('/api/medicines/1', headers={'Accept-Encoding': 'identity'}).get_data()
+    response = client.get('/api/medicines/1', headers={'Accept-Encoding': 'br'})
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()) == plain
+
+
+def test_only_detail_responses_are_stored(app, client):
+    store = app.extensions['compressed_body_store']
+
+    response = client.get('/api/medicines?per_page=50', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert len(store) == 0
+
+    client.get('/api/medicines/1', headers={'Accept-Encoding': 'gzip'})
+    assert len(store) == 1
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get('/api/medicines/1/alternatives', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers